@@ -12,7 +12,7 @@ declare -a process
 execute_make() {
 
     cd $dossier
-    make start -e GUI=0 > /dev/null && touch "end_$dossier" # start the simulation and create a temporary file to wait for the simulation to finish
+    make start -e GUI=0 WAVES=0 > /dev/null && touch "end_$dossier" # start the simulation without waveform logging and create a temporary file to wait for the simulation to finish
     wait # wait until the end of simulation
     printf "%s %s %s\n\n" "───────────────────────────────────────────────────────────────────────" "${blue}$dossier${reset}" "─────────────────────────────────────────────────────────────────────────────"
     cat workspace/log_sim | tail -n 15 # display the last fifteen lines of log_sim
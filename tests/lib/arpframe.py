@@ -16,8 +16,10 @@
 from dataclasses import dataclass
 # For Enumerate
 from enum import IntEnum
+# For frame packing
+from struct import Struct
 # For Payload
-from lib.payload import Payload
+from lib.payload import Payload, FRAME_DATACLASS_OPTIONS
 from lib.ethframe import EthFrame, ETHERTYPE_ENUM
 
 
@@ -26,6 +28,12 @@ ARP_HW_TYPE = 1
 ARP_HW_ADDR_LENGTH = 6
 ARP_PROTOCOL_ADDR_LENGTH = 4
 
+# ARP frame fields layout
+ARP_FRAME_STRUCT = Struct('>HHBBH6s4s6s4s')
+# Constant fields (HW type, protocol type and address lengths) are packed once
+ARP_FRAME_PREFIX = Struct('>HHBB').pack(ARP_HW_TYPE, ETHERTYPE_ENUM.IPV4, ARP_HW_ADDR_LENGTH, ARP_PROTOCOL_ADDR_LENGTH)
+ARP_FRAME_VAR_STRUCT = Struct('>H6s4s6s4s')
+
 
 # ARP Operation
 class ARP_OPCODE_ENUM(IntEnum):
@@ -35,7 +43,7 @@ class ARP_OPCODE_ENUM(IntEnum):
 
 
 @EthFrame.layer3(ETHERTYPE_ENUM.ARP)
-@dataclass
+@dataclass(**FRAME_DATACLASS_OPTIONS)
 class ArpFrame(Payload):
     """ dataclass use to describe an ARP frame inherit from Payload"""
     opcode: ARP_OPCODE_ENUM
@@ -46,19 +54,14 @@ class ArpFrame(Payload):
 
     def __bytes__(self) -> bytes:
         """ Convert the Payload to bytes """
-        return ARP_HW_TYPE.to_bytes(2, 'big') + ETHERTYPE_ENUM.IPV4.to_bytes(2, 'big') + \
-            ARP_HW_ADDR_LENGTH.to_bytes(1, 'big') + ARP_PROTOCOL_ADDR_LENGTH.to_bytes(1, 'big') + self.opcode.to_bytes(2, 'big') + \
-            self.sender_hw_addr + self.sender_protocol_addr + \
-            self.target_hw_addr + self.target_protocol_addr
+        return ARP_FRAME_PREFIX + ARP_FRAME_VAR_STRUCT.pack(self.opcode,
+                                                            self.sender_hw_addr, self.sender_protocol_addr,
+                                                            self.target_hw_addr, self.target_protocol_addr)
 
     @classmethod
     def from_bytes(cls, b: bytes) -> "Payload":
         """ Create an instance of Payload for bytes """
-        opcode = int.from_bytes(b[6:8], 'big')
-        sender_hw_addr = b[8:14]
-        sender_protocol_addr = b[14:18]
-        target_hw_addr = b[18:24]
-        target_protocol_addr = b[24:28]
+        _, _, _, _, opcode, sender_hw_addr, sender_protocol_addr, target_hw_addr, target_protocol_addr = ARP_FRAME_STRUCT.unpack_from(b)
 
         return cls(opcode, sender_hw_addr, sender_protocol_addr, target_hw_addr, target_protocol_addr)
 
@@ -18,8 +18,10 @@ from typing import ClassVar, Union
 from dataclasses import dataclass
 # For Enumerate
 from enum import IntEnum
+# For header packing
+from struct import Struct
 # For Payload
-from lib.payload import Payload
+from lib.payload import Payload, FRAME_DATACLASS_OPTIONS
 
 # Header MAC Description (14 Bytes)
 # |------|------|------|------|------|------|------|------|------|------|------|------|------|------|
@@ -27,6 +29,8 @@ from lib.payload import Payload
 # |------|------|------|------|------|------|------|------|------|------|------|------|------|------|
 # |  0   |                                                                                   |  13  |
 
+ETH_HEADER_STRUCT = Struct('>6s6sH')
+
 
 # Ethertype
 class ETHERTYPE_ENUM(IntEnum):
@@ -35,7 +39,7 @@ class ETHERTYPE_ENUM(IntEnum):
     ARP = 0x0806
 
 
-@dataclass
+@dataclass(**FRAME_DATACLASS_OPTIONS)
 class EthFrame(Payload):
     """ dataclass use to describe an Ethernet frame inherit from Payload"""
     dst_mac_addr: bytes
@@ -49,14 +53,12 @@ class EthFrame(Payload):
     def __bytes__(self) -> bytes:
         """ Convert the Payload to bytes """
         # print(bytes(self.payload).hex('_', 1))
-        return self.dst_mac_addr + self.src_mac_addr + self.ethertype.to_bytes(2, 'big') + bytes(self.payload)
+        return ETH_HEADER_STRUCT.pack(self.dst_mac_addr, self.src_mac_addr, self.ethertype) + bytes(self.payload)
 
     @classmethod
     def from_bytes(cls, b: bytes) -> "Payload":
         """ Create an instance of Payload for bytes """
-        dst_mac_addr = b[0:6]
-        src_mac_addr = b[6:12]
-        ethertype = int.from_bytes(b[12:14], 'big')
+        dst_mac_addr, src_mac_addr, ethertype = ETH_HEADER_STRUCT.unpack_from(b)
         payload = b[14:]
 
         payload_class = cls.ethertype_dict.get(ethertype)
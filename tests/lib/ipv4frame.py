@@ -18,8 +18,10 @@ from typing import ClassVar, Union
 from dataclasses import dataclass
 # For Enumerate
 from enum import IntEnum
+# For header words unpacking
+from struct import Struct
 # For Payload
-from lib.payload import Payload
+from lib.payload import Payload, FRAME_DATACLASS_OPTIONS
 from lib.ethframe import EthFrame, ETHERTYPE_ENUM
 
 # Header IPV4 Description (20 Bytes)
@@ -47,6 +49,11 @@ IPV4_HEADER_SERVICES = 0  # Not used
 
 IPV4_TTL_DEFAULT = 100    # Time To Leave
 
+# Header fields layout
+IPV4_HEADER_STRUCT = Struct('>BBHHHBBH4s4s')
+# Header split in 16-bit words for checksum computation
+IPV4_HEADER_WORDS = Struct('>10H')
+
 
 # Enumerate Subprotocol
 class IPV4_PROTOCOL_ENUM(IntEnum):
@@ -58,7 +65,7 @@ class IPV4_PROTOCOL_ENUM(IntEnum):
 
 
 @EthFrame.layer3(ETHERTYPE_ENUM.IPV4)
-@dataclass
+@dataclass(**FRAME_DATACLASS_OPTIONS)
 class Ipv4Frame(Payload):
     """ dataclass use to describe an IPv4 frame inherit from Payload"""
     frame_id: int
@@ -72,27 +79,28 @@ class Ipv4Frame(Payload):
 
     # Classe variable
     ipv4_protocol_dict: ClassVar[dict[int, "Payload"]] = {}
+    verify_checksum: ClassVar[bool] = True  # Check header checksum in from_bytes
 
-    def __header_with_null_crc(self):
+    def __header_with_null_crc(self, payload_len: int):
         """Convert the object header fields to bytes for checksum computation"""
-        return ((IPV4_HEADER_VERSION << 4) + IPV4_HEADER_LENGTH).to_bytes(1, 'big') + \
-            IPV4_HEADER_SERVICES.to_bytes(1, 'big') + ((4 * IPV4_HEADER_LENGTH) + len(bytes(self.payload))).to_bytes(2, 'big') + \
-            self.frame_id.to_bytes(2, 'big') + \
-            (((self.frag_flags & 0x7) << 13) + (self.frag_offset & 0x1FFF)).to_bytes(2, 'big') + \
-            self.ttl.to_bytes(1, 'big') + \
-            self.sub_protocol.to_bytes(1, 'big') + bytes(2) + \
-            self.ip_src + self.ip_dest
+        return IPV4_HEADER_STRUCT.pack((IPV4_HEADER_VERSION << 4) + IPV4_HEADER_LENGTH,
+                                       IPV4_HEADER_SERVICES, (4 * IPV4_HEADER_LENGTH) + payload_len,
+                                       self.frame_id,
+                                       ((self.frag_flags & 0x7) << 13) + (self.frag_offset & 0x1FFF),
+                                       self.ttl,
+                                       self.sub_protocol, 0,
+                                       self.ip_src, self.ip_dest)
 
     @staticmethod
     def compute_checksum(data: bytes):
         """ Compute checksum on the given data """
-        # Set CRC
-        data_null_checksum = data[:10] + bytes(2) + data[12:]
+        # Sum header words, skipping the checksum field (word 5)
+        words = IPV4_HEADER_WORDS.unpack_from(data)
+        crc = sum(words) - words[5]
 
-        # Compute crc
-        crc = 0
-        for i in range(10):
-            crc = (crc & 0xFFFF) + ((crc >> 16) & 0x1) + int.from_bytes(bytes=data_null_checksum[(2 * i):(2 * (i + 1))], byteorder='big')
+        # Fold carries
+        crc = (crc & 0xFFFF) + (crc >> 16)
+        crc = (crc & 0xFFFF) + (crc >> 16)
 
         # Complement and convert to bytes
         return (0xFFFF - crc).to_bytes(2, 'big')
@@ -100,29 +108,28 @@ class Ipv4Frame(Payload):
     def checksum(self):
         """ Return checksum of the current Header """
         # Get header in bytes
-        header = self.__header_with_null_crc()
+        header = self.__header_with_null_crc(len(bytes(self.payload)))
 
         return self.compute_checksum(header)
 
     def __bytes__(self) -> bytes:
         """ Convert the Payload to bytes """
-        header = self.__header_with_null_crc()
-        return header[:10] + self.checksum() + header[12:] + bytes(self.payload)
+        # Serialize payload only once
+        payload = bytes(self.payload)
+        header = self.__header_with_null_crc(len(payload))
+        return header[:10] + self.compute_checksum(header) + header[12:] + payload
 
     @classmethod
     def from_bytes(cls, b: bytes) -> "Payload":
         """ Create an instance of Payload for bytes """
-        frame_id = int.from_bytes(b[4:6], 'big')
-        frag_flags = (int.from_bytes(b[6:8], 'big') >> 13) & 0x7
-        frag_offset = int.from_bytes(b[6:8], 'big') & 0x1FFF
-        ttl = int.from_bytes(b[8:9], 'big')
-        sub_protocol = int.from_bytes(b[9:10], 'big')
-        ip_src = b[12:16]
-        ip_dest = b[16:20]
+        _, _, _, frame_id, frag, ttl, sub_protocol, crc, ip_src, ip_dest = IPV4_HEADER_STRUCT.unpack_from(b)
+        frag_flags = (frag >> 13) & 0x7
+        frag_offset = frag & 0x1FFF
         payload = b[20:]
 
         # Checksum
-        assert b[10:12] == cls.compute_checksum(b[:20]), "Checksum error"
+        if cls.verify_checksum:
+            assert crc.to_bytes(2, 'big') == cls.compute_checksum(b), "Checksum error"
 
         payload_class = cls.ipv4_protocol_dict.get(sub_protocol)
         if payload_class:
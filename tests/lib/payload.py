@@ -19,6 +19,15 @@
 
 # For absract classes and methods
 from abc import ABC, abstractmethod
+# For python version check
+import sys
+
+# --------------------------------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------------------------------
+
+# Dataclass options for frames : use __slots__ when supported (python >= 3.10)
+FRAME_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 # --------------------------------------------------------------------------------
@@ -27,6 +36,8 @@ from abc import ABC, abstractmethod
 class Payload(ABC):
     """Abstract class to inherit from for payload"""
 
+    __slots__ = ()
+
     def __len__(self) -> int:
         """Return the length of the Payload"""
         len(bytes(self))
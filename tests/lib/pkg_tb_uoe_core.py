@@ -16,15 +16,16 @@
 import random
 from random import randbytes
 from random import Random
+from struct import Struct
 
 import cocotb
 from cocotb.binary import BinaryValue
 from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamMonitor, AxiStreamFrame)
 
-from lib.ethframe import EthFrame
+from lib.ethframe import EthFrame, ETH_HEADER_STRUCT
 from lib.arpframe import ArpFrame
 from lib.udpframe import UdpFrame
-from lib.ipv4frame import Ipv4Frame
+from lib.ipv4frame import Ipv4Frame, IPV4_TTL_DEFAULT
 
 BROADCAST_IP_ADDR = 0xFF_FF_FF_FF
 BROADCAST_MAC_ADDR = 0xFF_FF_FF_FF_FF_FF
@@ -49,6 +50,14 @@ ETH_IP_ADDR_5 = 0xC0_A8_01_1E
 
 ETH_IP_LIST = [ETH_IP_ADDR_1, ETH_IP_ADDR_2, ETH_IP_ADDR_3, ETH_IP_ADDR_4]
 
+# Addresses encoded once as bytes
+ETH_MAC_BYTES = tuple(mac.to_bytes(6, 'big') for mac in ETH_MAC_LIST)
+ETH_IP_BYTES = tuple(ip.to_bytes(4, 'big') for ip in ETH_IP_LIST)
+BROADCAST_MAC_BYTES = BROADCAST_MAC_ADDR.to_bytes(6, 'big')
+ZERO_MAC_BYTES = ZERO_MAC_ADDR.to_bytes(6, 'big')
+ETH_MAC_ADDR_5_BYTES = ETH_MAC_ADDR_5.to_bytes(6, 'big')
+ETH_IP_ADDR_5_BYTES = ETH_IP_ADDR_5.to_bytes(4, 'big')
+
 ETH_PORT_ADDR_1 = 0x1234
 ETH_PORT_ADDR_2 = 0x5678
 ETH_PORT_ADDR_3 = 0x9ABC
@@ -148,46 +157,84 @@ IP_HEADER_SERVICES = 0x0
 TB_ETH_PKT_MIN_SIZE = 60
 ETH_PAYLOAD_ARP_SIZE = 28
 
+# Ethernet + IPv4 + UDP headers layout (42 bytes)
+ETH_IPV4_UDP_HEADER = Struct('>6s6sHBBHHHBBH4s4sHHHH')
+
 
 def add_padding(packet, nb_bytes_min):
-    if len(packet) < nb_bytes_min:
-        packet += bytes([0x00]) * (nb_bytes_min - len(packet))
-    return packet
+    """Pad packet with null bytes up to nb_bytes_min"""
+    return packet.ljust(nb_bytes_min, b'\x00')
+
+
+def mac_to_bytes(mac):
+    """Return MAC address as 6 bytes, already encoded addresses are returned as is"""
+    if isinstance(mac, (bytes, bytearray)):
+        return mac
+    return mac.to_bytes(6, 'big')
+
+
+def ip_to_bytes(ip):
+    """Return IP address as 4 bytes, already encoded addresses are returned as is"""
+    if isinstance(ip, (bytes, bytearray)):
+        return ip
+    return ip.to_bytes(4, 'big')
+
+
+def build_eth_wire(mac_dest, mac_src, ethertype, payload):
+    """Build Ethernet frame bytes from a raw payload"""
+    return ETH_HEADER_STRUCT.pack(mac_dest, mac_src, ethertype) + payload
+
+
+def build_ipv4_udp_wire(mac_dest, mac_src, ip_src, ip_dest, protocole, frame_id, port_src, port_dest, payload):
+    """Build Ethernet/IPv4/UDP frame bytes without intermediate frame objects"""
+    header = bytearray(ETH_IPV4_UDP_HEADER.pack(mac_dest, mac_src, ETHERTYPE_IPV4,
+                                                (IP_HEADER_VERSION << 4) + IP_HEADER_LENGTH, IP_HEADER_SERVICES,
+                                                IPV4_MIN_HEADER_SIZE + UDP_HEADER_SIZE + len(payload),
+                                                frame_id, 0, IPV4_TTL_DEFAULT, protocole, 0,
+                                                ip_src, ip_dest,
+                                                port_src, port_dest, UDP_HEADER_SIZE + len(payload), 0))
+    # Patch IPv4 header checksum
+    ipv4_header = header[MAC_HEADER_SIZE:MAC_HEADER_SIZE + IPV4_MIN_HEADER_SIZE]
+    header[MAC_HEADER_SIZE + 10:MAC_HEADER_SIZE + 12] = Ipv4Frame.compute_checksum(ipv4_header)
+    return bytes(header) + payload
 
 
 def generateFrame_UDP_TX(random_gen, size, dest, src, ip):
     # Generate tdata with dest_mac and src_mac
 
     tdata = random_gen.randbytes(size)
-    tuser = int.from_bytes(dest.to_bytes(2, 'big') + src.to_bytes(2, 'big') + size.to_bytes(2, 'big') + ip.to_bytes(4, 'big'), 'big')
-    tkeep = [1] * len(tdata)
-    frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=tuser)
+    tuser = (dest << 64) | (src << 48) | (size << 32) | ip  # dest(16) & src(16) & size(16) & ip(32)
+    # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+    frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=tuser)
     return frame
 
 
 def generateFrame_ARP_v2(opcode, mac_src, mac_dest, ip_src, ip_dest, padding_en=False):
 
-    if mac_dest == ARP_BROADCAST_MAC:
-        dest = ZERO_MAC_ADDR
+    mac_src = mac_to_bytes(mac_src)
+    mac_dest = mac_to_bytes(mac_dest)
+
+    if mac_dest == BROADCAST_MAC_BYTES:
+        dest = ZERO_MAC_BYTES
     else:
         dest = mac_dest
 
     arp_part = ArpFrame(opcode,
-                        mac_src.to_bytes(6, 'big'),
-                        ip_src.to_bytes(4, 'big'),
-                        dest.to_bytes(6, 'big'),
-                        ip_dest.to_bytes(4, 'big'))
-    data = EthFrame(mac_dest.to_bytes(6, 'big'),
-                    mac_src.to_bytes(6, 'big'),
+                        mac_src,
+                        ip_to_bytes(ip_src),
+                        dest,
+                        ip_to_bytes(ip_dest))
+    data = EthFrame(mac_dest,
+                    mac_src,
                     ETHERTYPE_ARP,
                     arp_part)
-    data = EthFrame.__bytes__(data)
+    tdata = bytes(data)
 
     if padding_en:
-        tdata = add_padding(data, TB_ETH_PKT_MIN_SIZE)
+        tdata = add_padding(tdata, TB_ETH_PKT_MIN_SIZE)
 
-    tkeep = [1] * len(tdata)
-    frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
+    # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+    frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=None)
     return frame
 
 
@@ -198,28 +245,21 @@ def generateFrame_IPV4(random_gen, mac_src, ip_src, mac_dest, ip_dest, protocole
     else:
         eth_nb_bytes = nb_bytes
 
-    udp_part = UdpFrame(port_src,
-                        port_dest,
-                        random_gen.randbytes(eth_nb_bytes))
-
-    ipv4_part = Ipv4Frame(frame_id,
-                          protocole,
-                          ip_src.to_bytes(4, 'big'),
-                          ip_dest.to_bytes(4, 'big'),
-                          udp_part)
-
-    data = EthFrame(mac_dest.to_bytes(6, 'big'),
-                    mac_src.to_bytes(6, 'big'),
-                    ETHERTYPE_IPV4,
-                    ipv4_part)
-
-    tdata = EthFrame.__bytes__(data)
+    tdata = build_ipv4_udp_wire(mac_to_bytes(mac_dest),
+                                mac_to_bytes(mac_src),
+                                ip_to_bytes(ip_src),
+                                ip_to_bytes(ip_dest),
+                                protocole,
+                                frame_id,
+                                port_src,
+                                port_dest,
+                                random_gen.randbytes(eth_nb_bytes))
 
     if padding_en:
-        tdata = add_padding(data, TB_ETH_PKT_MIN_SIZE)
+        tdata = add_padding(tdata, TB_ETH_PKT_MIN_SIZE)
 
-    tkeep = [1] * len(tdata)
-    frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
+    # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+    frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=None)
     return frame
 
 
@@ -228,9 +268,9 @@ def generateFrame_RAW_TX(random_gen, min_size, max_size):
     while True:
         size = random_gen.randint(min_size, max_size)  # Generate random size
         tdata = random_gen.randbytes(size)  # Generate tdata with random bytes
-        tkeep = [1] * len(tdata)  # Generate tkeep
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
         tuser = ETHERTYPE_RAW  # Generate tid with random ethertype
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=tuser)
+        frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=tuser)
         yield frame
 
 
@@ -238,20 +278,17 @@ def generateFrame_RAW_RX(random_gen, min_size, max_size, dest, src):
     """Generation of RAW frame with pseudo-random way"""
     size = random_gen.randint(min_size, max_size)  # Generate random size
     # Building axis frame with ethernet protocole
-    tdata = EthFrame(dest.to_bytes(6, 'big'), src.to_bytes(6, 'big'), ETHERTYPE_RAW, random_gen.randbytes(size))
-    tdata = tdata.__bytes__()
-    tkeep = [1] * len(tdata)  # Generate tkeep
-    frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
+    tdata = build_eth_wire(mac_to_bytes(dest), mac_to_bytes(src), ETHERTYPE_RAW, random_gen.randbytes(size))
+    # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+    frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=None)
     return frame
 
 
 def generateFrame_ETH_RX(random_gen, min_size, max_size, dest, src):
     """Generation of RAW frame with pseudo-random way"""
-    while True:
-        size = random_gen.randint(min_size, max_size)  # Generate random size
-        # Building axis frame with ethernet protocole
-        tdata = EthFrame(dest.to_bytes(6, 'big'), src.to_bytes(6, 'big'), ETHERTYPE_UNKNOWN, random_gen.randbytes(size))
-        tdata = tdata.__bytes__()
-        tkeep = [1] * len(tdata)  # Generate tkeep
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
-        return frame
+    size = random_gen.randint(min_size, max_size)  # Generate random size
+    # Building axis frame with ethernet protocole
+    tdata = build_eth_wire(mac_to_bytes(dest), mac_to_bytes(src), ETHERTYPE_UNKNOWN, random_gen.randbytes(size))
+    # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+    frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=None)
+    return frame
@@ -14,8 +14,10 @@
 
 # Dataclasses are uses to represent Frames
 from dataclasses import dataclass
+# For header packing
+from struct import Struct
 # For Payload
-from lib.payload import Payload
+from lib.payload import Payload, FRAME_DATACLASS_OPTIONS
 from lib.ipv4frame import Ipv4Frame, IPV4_PROTOCOL_ENUM
 
 # Header UDP Description (8 bytes)
@@ -27,10 +29,11 @@ from lib.ipv4frame import Ipv4Frame, IPV4_PROTOCOL_ENUM
 
 # UDP Constants
 UDP_HEADER_LENGTH = 8  # Size in bytes
+UDP_HEADER_STRUCT = Struct('>HHHH')
 
 
 @Ipv4Frame.layer4(IPV4_PROTOCOL_ENUM.UDP)
-@dataclass
+@dataclass(**FRAME_DATACLASS_OPTIONS)
 class UdpFrame(Payload):
     """ dataclass use to describe an UDP frame inherit from Payload"""
     src_port: int
@@ -39,15 +42,13 @@ class UdpFrame(Payload):
 
     def __bytes__(self) -> bytes:
         """Convert the Payload to bytes"""
-        return self.src_port.to_bytes(2, 'big') + self.dst_port.to_bytes(2, 'big') + \
-            (UDP_HEADER_LENGTH + len(bytes(self.payload))).to_bytes(2, 'big') + bytes(2) + \
-            bytes(self.payload)
+        payload = bytes(self.payload)
+        return UDP_HEADER_STRUCT.pack(self.src_port, self.dst_port, UDP_HEADER_LENGTH + len(payload), 0) + payload
 
     @classmethod
     def from_bytes(cls, b: bytes) -> "Payload":
         """Create an instance of Payload for bytes"""
-        src_port = int.from_bytes(b[0:2], 'big')
-        dst_port = int.from_bytes(b[2:4], 'big')
+        src_port, dst_port, _, _ = UDP_HEADER_STRUCT.unpack_from(b)
         payload = b[8:]
 
         return cls(src_port, dst_port, payload)
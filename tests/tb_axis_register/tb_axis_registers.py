@@ -22,6 +22,7 @@ from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStre
 
 # Others
 import os
+import logging
 from random import Random
 
 # Global Parameters
@@ -37,18 +38,28 @@ async def handlerReset(dut):
 
 # Generator to generate transfer
 def genRandomTransfer(random_gen):
+    # Bus widths read once from the environment
+    tkeep_width = int(os.getenv('G_TDATA_WIDTH')) // 8
+    tuser_width = int(os.getenv('G_TUSER_WIDTH'))
+    tid_width = int(os.getenv('G_TID_WIDTH'))
+    tdest_width = int(os.getenv('G_TDEST_WIDTH'))
+
+    # Local bindings of the random generator methods
+    randint = random_gen.randint
+    randbytes = random_gen.randbytes
+    getrandbits = random_gen.getrandbits
+
     while True:
-        size = random_gen.randint(1, 20)
-        tdata = random_gen.randbytes(size)
+        size = randint(1, 20)
+        tdata = randbytes(size)
         # tkeep = [random_gen.randint(0,1) for _ in range(size)]
-        tkeep = [random_gen.getrandbits(int(int(os.getenv('G_TDATA_WIDTH')) / 8))]
-        print(tkeep)
-        tuser = [random_gen.getrandbits(int(os.getenv('G_TUSER_WIDTH'))) for _ in range(size)]
-        tid = random_gen.getrandbits(int(os.getenv('G_TID_WIDTH')))
-        tdest = random_gen.getrandbits(int(os.getenv('G_TDEST_WIDTH')))
+        tkeep = [getrandbits(tkeep_width)]
+        tuser = [getrandbits(tuser_width) for _ in range(size)]
+        tid = getrandbits(tid_width)
+        tdest = getrandbits(tdest_width)
         frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=tid, tdest=tdest, tuser=tuser)
-        print("===========================================================================")
-        print(frame)
+        if cocotb.log.isEnabledFor(logging.DEBUG):
+            cocotb.log.debug("Generated frame : %r", frame)
         yield frame
 
 
@@ -57,8 +68,7 @@ async def handlerSlave(dut):
 
     # Init source and random generator
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s"), dut.clk, dut.rst, reset_active_level=False)
-    s_random = Random()
-    s_random.seed(5)
+    s_random = Random(5)
     s_trans = genRandomTransfer(s_random)
 
     await RisingEdge(dut.rst)
@@ -72,10 +82,8 @@ async def handlerSlave(dut):
 # coroutine to handle Master interface
 async def handlerMaster(dut):
 
-    # Init sink and random generator
+    # Init sink
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m"), dut.clk, dut.rst, reset_active_level=False)
-    m_random = Random()
-    m_random.seed(5)
 
     await RisingEdge(dut.rst)
     await RisingEdge(dut.clk)
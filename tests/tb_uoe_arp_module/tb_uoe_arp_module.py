@@ -17,12 +17,10 @@ import cocotb
 from cocotb.triggers import Timer
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge
-from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamMonitor, AxiStreamFrame)
+from cocotb.triggers import ClockCycles
+from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
-from random import Random
 import logging
 
 # ARP Library
@@ -54,23 +52,55 @@ ARP_OPCODE_REPLY = 0x0002
 STATUS_VALID = 0
 STATUS_INVALID = 1
 
+# ARP frame template with constant fields (ethertype, ARP HW/protocol types and lengths) preloaded
+ARP_FRAME_TEMPLATE = bytes(EthFrame(dst_mac_addr=bytes(6),
+                                    src_mac_addr=bytes(6),
+                                    ethertype=ETHERTYPE_ARP,
+                                    payload=ArpFrame(opcode=0,
+                                                     sender_hw_addr=bytes(6),
+                                                     sender_protocol_addr=bytes(4),
+                                                     target_hw_addr=bytes(6),
+                                                     target_protocol_addr=bytes(4))))
+
+# Constant tkeep lists of fixed size frames (AxiStreamSource does not modify them)
+ARP_FRAME_TKEEP = [1] * len(ARP_FRAME_TEMPLATE)
+IP_ADDR_TKEEP = [1] * 4
+
+# Expected addresses returned to arp_table
+ETH_IP_ADDR_1_BYTES = ETH_IP_ADDR_1.to_bytes(4, 'big')
+ETH_IP_ADDR_2_BYTES = ETH_IP_ADDR_2.to_bytes(4, 'big')
+ETH_MAC_ADDR_2_BYTES = ETH_MAC_ADDR_2.to_bytes(6, 'big')
+ZERO_MAC_ADDR_BYTES = ZERO_MAC_ADDR.to_bytes(6, 'big')
+
+# Testbench banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "* The role of the ARP sub-module is to manage the transmission and reception of ARP frames on the network.                                               *\n"
+               "* ARP makes it possible to associate a network layer address (IP address) of a remote host with its physical layer address (MAC Address).                *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n***************************************************************************************\n"
+                 "**                                 There are %d errors !                             **\n"
+                 "***************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n***************************************************************************************\n"
+                "**                                      Simulation OK !                              **\n"
+                "***************************************************************************************")
+
 
 def genArpTrame_to_axis(opcode, mac_src, ip_src, mac_dest, ip_dest):
     """function to generate ARP frame to be sent to arp_module"""
-    # Building axis frame with ethernet_arp protocole
-    arp_part = ArpFrame(opcode=opcode,
-                        sender_hw_addr=mac_src.to_bytes(6, 'big'),
-                        sender_protocol_addr=ip_src.to_bytes(4, 'big'),
-                        target_hw_addr=mac_dest.to_bytes(6, 'big'),
-                        target_protocol_addr=ip_dest.to_bytes(4, 'big'))
-
-    tdata = EthFrame(dst_mac_addr=mac_dest.to_bytes(6, 'big'),
-                     src_mac_addr=mac_src.to_bytes(6, 'big'),
-                     ethertype=ETHERTYPE_ARP,
-                     payload=arp_part)
-    tdata = EthFrame.__bytes__(tdata)
-    tkeep = [1] * len(tdata)  # Generate tkeep
-    frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
+    # Building axis frame with ethernet_arp protocole : only variable fields are patched in the template
+    mac_src = mac_src.to_bytes(6, 'big')
+    mac_dest = mac_dest.to_bytes(6, 'big')
+    tdata = bytearray(ARP_FRAME_TEMPLATE)
+    tdata[0:6] = mac_dest
+    tdata[6:12] = mac_src
+    tdata[20:22] = opcode.to_bytes(2, 'big')
+    tdata[22:28] = mac_src
+    tdata[28:32] = ip_src.to_bytes(4, 'big')
+    tdata[32:38] = mac_dest
+    tdata[38:42] = ip_dest.to_bytes(4, 'big')
+    frame = AxiStreamFrame(tdata=tdata, tkeep=ARP_FRAME_TKEEP, tid=None, tdest=None, tuser=None)
     return frame
 
 
@@ -80,31 +110,32 @@ def arp_check(data, opcode_ctrl, ip_dest_ctrl, mac_dest_ctrl, indice):
     # Error variable
     global simulation_err
 
-    # Validity test
+    # Validity test : target hardware and protocol addresses are compared in place (bytes 32 to 41)
     if mac_dest_ctrl == BROADCAST_MAC_ADDR:
         mac_dest_ctrl = ZERO_MAC_ADDR
-    data = EthFrame.from_bytes(data)
-    data_arp = data.payload
-    data_ctrl = ArpFrame(opcode=opcode_ctrl,
-                         sender_hw_addr=int(0).to_bytes(6, 'big'),
-                         sender_protocol_addr=int(0).to_bytes(4, 'big'),
-                         target_hw_addr=mac_dest_ctrl.to_bytes(6, 'big'),
-                         target_protocol_addr=ip_dest_ctrl.to_bytes(4, 'big'))
-
-    if data_arp.target_hw_addr == data_ctrl.target_hw_addr and data_arp.target_protocol_addr == data_ctrl.target_protocol_addr:
+    target_ctrl = mac_dest_ctrl.to_bytes(6, 'big') + ip_dest_ctrl.to_bytes(4, 'big')
+
+    if data[32:42] == target_ctrl:
         if DEBUG == 1:
-            if data_arp.opcode == ARP_OPCODE_REQUEST:
+            if int.from_bytes(data[20:22], 'big') == ARP_OPCODE_REQUEST:
                 cocotb.log.info("ARP request is OK")
             else:
                 cocotb.log.info("ARP reply is OK")
     else:
+        # Frame is only parsed for diagnostic
+        data_arp = EthFrame.from_bytes(data).payload
+        data_ctrl = ArpFrame(opcode=opcode_ctrl,
+                             sender_hw_addr=bytes(6),
+                             sender_protocol_addr=bytes(4),
+                             target_hw_addr=target_ctrl[0:6],
+                             target_protocol_addr=target_ctrl[6:10])
         if data_arp.opcode == ARP_OPCODE_REQUEST:
-            cocotb.log.error(f"ARP request {indice} faillure")
+            cocotb.log.error("ARP request %s faillure", indice)
         else:
-            cocotb.log.error(f"ARP reply {indice} faillure")
-        cocotb.log.error(f"OPCODE : {hex(data_arp.opcode)} / OPCODE_CTRL : {hex(opcode_ctrl)}")
-        cocotb.log.error(f"IP_DEST : {data_arp.target_protocol_addr.hex()} / IP_DEST_CTRL : {data_ctrl.target_protocol_addr.hex()}")
-        cocotb.log.error(f"MAC_DEST : {data_arp.target_hw_addr.hex()} / MAC_DEST_CTRL : {data_ctrl.target_hw_addr.hex()}")
+            cocotb.log.error("ARP reply %s faillure", indice)
+        cocotb.log.error("OPCODE : %#x / OPCODE_CTRL : %#x", data_arp.opcode, opcode_ctrl)
+        cocotb.log.error("IP_DEST : %s / IP_DEST_CTRL : %s", data_arp.target_protocol_addr.hex(), data_ctrl.target_protocol_addr.hex())
+        cocotb.log.error("MAC_DEST : %s / MAC_DEST_CTRL : %s", data_arp.target_hw_addr.hex(), data_ctrl.target_hw_addr.hex())
         simulation_err += 1
 
 
@@ -124,11 +155,6 @@ async def handlerSlave_rx(dut):
     logging.getLogger("cocotb.uoe_arp_module.s_rx").setLevel("WARNING")
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s_rx"), dut.clk, dut.rst, reset_active_level=False)
 
-    # Init random generator
-    s_random = Random()
-    s_random.seed(5)
-    # s_trans = genRandomTransfer_rx(s_random, 1)
-
     # Init signals
     dut.s_rx_tkeep = 0
     dut.s_rx_tdata = 0
@@ -137,18 +163,21 @@ async def handlerSlave_rx(dut):
     await RisingEdge(dut.clk)
     await RisingEdge(dut.ARP_INIT_DONE)
 
-    # Data send
-    await slave.send(genArpTrame_to_axis(opcode=ARP_OPCODE_REQUEST,
-                                         mac_src=ETH_MAC_ADDR_2,
-                                         ip_src=ETH_IP_ADDR_2,
-                                         mac_dest=BROADCAST_MAC_ADDR,
-                                         ip_dest=LOCAL_IP_ADDR))
-
-    await slave.send(genArpTrame_to_axis(opcode=ARP_OPCODE_REPLY,
-                                         mac_src=ETH_MAC_ADDR_2,
-                                         ip_src=ETH_IP_ADDR_2,
-                                         mac_dest=ETH_MAC_ADDR_3,
-                                         ip_dest=ETH_IP_ADDR_3))
+    # Frames built before sending
+    frame_request = genArpTrame_to_axis(opcode=ARP_OPCODE_REQUEST,
+                                        mac_src=ETH_MAC_ADDR_2,
+                                        ip_src=ETH_IP_ADDR_2,
+                                        mac_dest=BROADCAST_MAC_ADDR,
+                                        ip_dest=LOCAL_IP_ADDR)
+    frame_reply = genArpTrame_to_axis(opcode=ARP_OPCODE_REPLY,
+                                      mac_src=ETH_MAC_ADDR_2,
+                                      ip_src=ETH_IP_ADDR_2,
+                                      mac_dest=ETH_MAC_ADDR_3,
+                                      ip_dest=ETH_IP_ADDR_3)
+
+    # Data send : both frames queued back-to-back (source queue is unbounded)
+    slave.send_nowait(frame_request)
+    slave.send_nowait(frame_reply)
 
     cocotb.log.info("End of handlerSlave_rx")
 
@@ -172,8 +201,7 @@ async def handlerSlave_ip_addr(dut):
     # Test 1 : MAC_SHAPING Request => ARP_TX / ARP_RX => MAC_SHAPING Return
     # use ETH_IP_ADDR_1 for this test
     tdata = ETH_IP_ADDR_1.to_bytes(4, 'little')  # Generate tdata with ethernet ip address 1
-    tkeep = [1] * len(tdata)  # Generate tkeep
-    frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
+    frame = AxiStreamFrame(tdata=tdata, tkeep=IP_ADDR_TKEEP, tid=None, tdest=None, tuser=None)
     await slave.send(frame)
 
     cocotb.log.info("End of handlerSlave_ip_addr")
@@ -252,27 +280,28 @@ async def handlerMaster_ip_mac_addr(dut):
 
     for _ in range(2):
         data = await master.recv()
-        mac_addr = int.from_bytes(data.tdata[4:10], 'big').to_bytes(6, 'little')
-        ip_addr = int.from_bytes(data.tdata[0:4], 'big').to_bytes(4, 'little')
+        # Addresses are received little endian
+        mac_addr = bytes(data.tdata[9:3:-1])
+        ip_addr = bytes(data.tdata[3::-1])
         if _ == 0:
-            if mac_addr == ETH_MAC_ADDR_2.to_bytes(6, 'big') and ip_addr == ETH_IP_ADDR_2.to_bytes(4, 'big') and data.tuser == STATUS_VALID:
+            if mac_addr == ETH_MAC_ADDR_2_BYTES and ip_addr == ETH_IP_ADDR_2_BYTES and data.tuser == STATUS_VALID:
                 if DEBUG == 1:
                     cocotb.log.info("M_IP_MAC_ADDR is OK")
             else:
-                cocotb.log.error(f"M_IP_MAC_ADDR faillure")
-                cocotb.log.error(f"MAC_ADDR : {mac_addr.hex()} / MAC_ADDR_CTRL : {ETH_MAC_ADDR_2.to_bytes(6, 'big').hex()}")
-                cocotb.log.error(f"IP_ADDR : {ip_addr.hex()} / IP_ADDR_CTRL : {ETH_IP_ADDR_2.to_bytes(4, 'big').hex()}")
-                cocotb.log.error(f"STATUS : {data.tuser}")
+                cocotb.log.error("M_IP_MAC_ADDR faillure")
+                cocotb.log.error("MAC_ADDR : %s / MAC_ADDR_CTRL : %s", mac_addr.hex(), ETH_MAC_ADDR_2_BYTES.hex())
+                cocotb.log.error("IP_ADDR : %s / IP_ADDR_CTRL : %s", ip_addr.hex(), ETH_IP_ADDR_2_BYTES.hex())
+                cocotb.log.error("STATUS : %s", data.tuser)
                 simulation_err += 1
         else:
-            if mac_addr == ZERO_MAC_ADDR.to_bytes(6, 'big') and ip_addr == ETH_IP_ADDR_1.to_bytes(4, 'big') and data.tuser == STATUS_INVALID:
+            if mac_addr == ZERO_MAC_ADDR_BYTES and ip_addr == ETH_IP_ADDR_1_BYTES and data.tuser == STATUS_INVALID:
                 if DEBUG == 1:
                     cocotb.log.info("M_IP_MAC_ADDR is OK")
             else:
-                cocotb.log.error(f"M_IP_MAC_ADDR faillure")
-                cocotb.log.error(f"MAC_ADDR : {mac_addr.hex()} / MAC_ADDR_CTRL : {ZERO_MAC_ADDR.to_bytes(6, 'big').hex()}")
-                cocotb.log.error(f"IP_ADDR : {ip_addr.hex()} / IP_ADDR_CTRL : {ETH_IP_ADDR_1.to_bytes(4, 'big').hex()}")
-                cocotb.log.error(f"STATUS : {data.tuser}")
+                cocotb.log.error("M_IP_MAC_ADDR faillure")
+                cocotb.log.error("MAC_ADDR : %s / MAC_ADDR_CTRL : %s", mac_addr.hex(), ZERO_MAC_ADDR_BYTES.hex())
+                cocotb.log.error("IP_ADDR : %s / IP_ADDR_CTRL : %s", ip_addr.hex(), ETH_IP_ADDR_1_BYTES.hex())
+                cocotb.log.error("STATUS : %s", data.tuser)
                 simulation_err += 1
 
     cocotb.log.info("End of handlerMaster_ip_mac_addr")
@@ -282,14 +311,7 @@ async def handlerMaster_ip_mac_addr(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "* The role of the ARP sub-module is to manage the transmission and reception of ARP frames on the network.                                               *\n"
-    description += "* ARP makes it possible to associate a network layer address (IP address) of a remote host with its physical layer address (MAC Address).                *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     # Error variable
@@ -323,8 +345,7 @@ async def handlermain(dut):
     await RisingEdge(dut.rst)
     await RisingEdge(dut.clk)
 
-    for _ in range(5):
-        await RisingEdge(dut.clk)
+    await ClockCycles(dut.clk, 5)
 
     # Stimulis
     dut.init_done = 1
@@ -340,12 +361,6 @@ async def handlermain(dut):
     await Timer(5, units='us')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n***************************************************************************************\n"
-        print_rsl += "**                                 There are " + str(simulation_err) + " errors !                             **\n"
-        print_rsl += "***************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n***************************************************************************************\n"
-        print_rsl += "**                                      Simulation OK !                              **\n"
-        print_rsl += "***************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)
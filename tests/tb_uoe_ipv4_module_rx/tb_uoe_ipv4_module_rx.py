@@ -27,13 +27,10 @@ import cocotb
 from cocotb.triggers import Timer
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge
-from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamMonitor, AxiStreamFrame)
+from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
 from random import Random
-from math import *
 import logging
 
 # IPV4 Library
@@ -67,6 +64,27 @@ IPV4_MAX_PAYLOAD_SIZE = IPV4_MAX_PACKET_SIZE - IPV4_MIN_HEADER_SIZE  # 1480
 PAYLOAD_SIZE_BYTES = 1480
 FRAGMENT_OFFSET_INC = int(PAYLOAD_SIZE_BYTES / 8)
 
+# Addresses encoded once for frame building
+LOCAL_IP_ADDR_BYTES = LOCAL_IP_ADDR.to_bytes(4, 'big')
+ETH_IP_ADDR_BYTES_LIST = [ip.to_bytes(4, 'big') for ip in ETH_IP_ADDR_LIST]
+
+
+# Banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "* The role of the ipv4 sub-module is to :                                                                                                                *\n"
+               "* Manage the IPv4 protocol and its fragmentation features                                                                                                *\n"
+               "* Partial ICMP protocol management (ping and ping response)                                                                                              *\n"
+               "* Supports data padding during transmission (if enabled)                                                                                                 *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n*******************************************************************************************\n"
+                 "**                                   There are %d errors !                               **\n"
+                 "*******************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n*******************************************************************************************\n"
+                "**                                        Simulation OK !                                **\n"
+                "*******************************************************************************************")
+
 
 # coroutine to handle Reset
 async def handlerReset(dut):
@@ -85,28 +103,29 @@ async def handlerSlave(dut):
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_ctrl_random = Random()
-    s_ctrl_random.seed(SEED)
-    s_data_random = Random()
-    s_data_random.seed(SEED)
-
-    await RisingEdge(dut.rst)
-    await RisingEdge(dut.clk)
+    s_ctrl_random = Random(SEED)
+    s_data_random = Random(SEED)
 
-    # Data send
+    # Frames are built before the simulation starts
+    slave_frames = []
     for _ in range(NB_FRAME):
 
         # slave_frame_nb_btes = FRAME_SIZE_LIST[s_ctrl_random.randint(0, 4)]
         slave_frame_nb_btes = s_ctrl_random.randint(FRAME_SIZE_1, FRAME_SIZE_2)
-        slave_ip = ETH_IP_ADDR_LIST[s_ctrl_random.randint(0, 3)]
+        slave_ip = ETH_IP_ADDR_BYTES_LIST[s_ctrl_random.randint(0, 3)]
 
-        cocotb.log.info(f"Frame : {_} / Size : {slave_frame_nb_btes}")
+        if DEBUG == 1:
+            cocotb.log.info("Frame : %d / Size : %d", _, slave_frame_nb_btes)
 
         slave_frag_offset = 0
 
+        # Payload of the whole frame is drawn once, fragments are sliced from it
+        slave_frame_bytes = s_data_random.randbytes(slave_frame_nb_btes)
+        slave_pkt_offset = 0
+
         # s_trans = genRandomTransfer_Ipv4(s_data_random, s_ctrl_random, slave_frag_offset, _)
 
-        for i in range(1, ceil(slave_frame_nb_btes / PAYLOAD_SIZE_BYTES) + 1):
+        for i in range(1, (slave_frame_nb_btes + PAYLOAD_SIZE_BYTES - 1) // PAYLOAD_SIZE_BYTES + 1):
             # Calcul size of payload
             if slave_frame_nb_btes > PAYLOAD_SIZE_BYTES:
                 slave_pkt_nb_bytes = PAYLOAD_SIZE_BYTES
@@ -116,30 +135,40 @@ async def handlerSlave(dut):
                 slave_pkt_nb_bytes = slave_frame_nb_btes
                 slave_frag_more = 0
 
-            cocotb.log.info(f"  packet : {i} / size packet : {slave_pkt_nb_bytes}")
+            if DEBUG == 1:
+                cocotb.log.info("  packet : %d / size packet : %d", i, slave_pkt_nb_bytes)
 
-            slave_packet_bytes = s_data_random.randbytes(slave_pkt_nb_bytes)
+            slave_packet_bytes = slave_frame_bytes[slave_pkt_offset:slave_pkt_offset + slave_pkt_nb_bytes]
+            slave_pkt_offset += slave_pkt_nb_bytes
 
             # Building axis frame with ethernet ipv4 protocole
             tdata = Ipv4Frame(frame_id=i - 1,
                               sub_protocol=PROTOCOL_UDP,
-                              ip_src=slave_ip.to_bytes(4, 'big'),
-                              ip_dest=LOCAL_IP_ADDR.to_bytes(4, 'big'),
+                              ip_src=slave_ip,
+                              ip_dest=LOCAL_IP_ADDR_BYTES,
                               payload=slave_packet_bytes,
                               ttl=TTL,
                               frag_flags=slave_frag_more,
                               frag_offset=slave_frag_offset)
-            tdata = Ipv4Frame.__bytes__(tdata)
+            tdata = bytes(tdata)
             if len(tdata) < 50:
-                tdata += int(0x00).to_bytes(50 - len(tdata), 'big')
-                cocotb.log.info(f"DATA_PADDING : {tdata.hex()}")
-            tkeep = [1] * len(tdata)
-            cocotb.log.info(f"      len(tdata) : {len(tdata)}")
-            frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
-            await slave.send(frame)
+                tdata = tdata.ljust(50, b'\x00')
+                if DEBUG == 1:
+                    cocotb.log.info("DATA_PADDING : %s", tdata.hex())
+            if DEBUG == 1:
+                cocotb.log.info("      len(tdata) : %d", len(tdata))
+            # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+            slave_frames.append(AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=None))
 
         slave_frag_offset += FRAGMENT_OFFSET_INC
 
+    await RisingEdge(dut.rst)
+    await RisingEdge(dut.clk)
+
+    # Data send
+    for frame in slave_frames:
+        await slave.send(frame)
+
     cocotb.log.info("End of handlerSlave")
 
 
@@ -154,10 +183,8 @@ async def handlerMaster(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_ctrl_random = Random()
-    m_ctrl_random.seed(SEED)
-    m_data_random = Random()
-    m_data_random.seed(SEED)
+    m_ctrl_random = Random(SEED)
+    m_data_random = Random(SEED)
 
     await RisingEdge(dut.rst)
     await RisingEdge(dut.clk)
@@ -169,20 +196,8 @@ async def handlerMaster(dut):
         master_frame_nb_btes = m_ctrl_random.randint(FRAME_SIZE_1, FRAME_SIZE_2)
         master_ip = ETH_IP_ADDR_LIST[m_ctrl_random.randint(0, 3)]
 
-        for i in range(1, ceil(master_frame_nb_btes / PAYLOAD_SIZE_BYTES) + 1):
-            # Calcul size of payload
-            if master_frame_nb_btes > PAYLOAD_SIZE_BYTES:
-                master_pkt_nb_bytes = PAYLOAD_SIZE_BYTES
-                master_frame_nb_btes = master_frame_nb_btes - PAYLOAD_SIZE_BYTES
-                master_frag_more = 1
-            else:
-                master_pkt_nb_bytes = master_frame_nb_btes
-                master_frag_more = 0
-
-            if i == 1:
-                master_packet_bytes = m_data_random.randbytes(master_pkt_nb_bytes)
-            else:
-                master_packet_bytes += m_data_random.randbytes(master_pkt_nb_bytes)
+        # Reassembled payload is drawn in one call, as on the slave side
+        master_packet_bytes = m_data_random.randbytes(master_frame_nb_btes)
 
         data = await master.recv()
         if data.tdata == master_packet_bytes:
@@ -200,16 +215,7 @@ async def handlerMaster(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "* The role of the ipv4 sub-module is to :                                                                                                                *\n"
-    description += "* Manage the IPv4 protocol and its fragmentation features                                                                                                *\n"
-    description += "* Partial ICMP protocol management (ping and ping response)                                                                                              *\n"
-    description += "* Supports data padding during transmission (if enabled)                                                                                                 *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     # Error variable
@@ -238,12 +244,6 @@ async def handlermain(dut):
     await Timer(5, units='us')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n*******************************************************************************************\n"
-        print_rsl += "**                                   There are " + str(simulation_err) + " errors !                               **\n"
-        print_rsl += "*******************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n*******************************************************************************************\n"
-        print_rsl += "**                                        Simulation OK !                                **\n"
-        print_rsl += "*******************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)
@@ -17,13 +17,10 @@ import cocotb
 from cocotb.triggers import Timer
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge
-from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamMonitor, AxiStreamFrame)
+from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
 from random import Random
-from math import *
 import logging
 
 # IPV4 Library
@@ -59,6 +56,27 @@ IPV4_MAX_PAYLOAD_SIZE = IPV4_MAX_PACKET_SIZE - IPV4_MIN_HEADER_SIZE  # 1480
 PAYLOAD_SIZE_BYTES = 1480
 FRAGMENT_OFFSET_INC = int(PAYLOAD_SIZE_BYTES / 8)
 
+# Addresses encoded once for frame building
+LOCAL_IP_ADDR_BYTES = LOCAL_IP_ADDR.to_bytes(4, 'big')
+ETH_IP_ADDR_BYTES_LIST = [ip.to_bytes(4, 'big') for ip in ETH_IP_ADDR_LIST]
+
+
+# Banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "* The role of the ipv4 sub-module is to :                                                                                                                *\n"
+               "* Manage the IPv4 protocol and its fragmentation features                                                                                                *\n"
+               "* Partial ICMP protocol management (ping and ping response)                                                                                              *\n"
+               "* Supports data padding during transmission (if enabled)                                                                                                 *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n*******************************************************************************************\n"
+                 "**                                   There are %d errors !                               **\n"
+                 "*******************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n*******************************************************************************************\n"
+                "**                                        Simulation OK !                                **\n"
+                "*******************************************************************************************")
+
 
 # coroutine to handle Reset
 async def handlerReset(dut):
@@ -85,15 +103,11 @@ async def handlerSlave(dut):
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_ctrl_random = Random()
-    s_ctrl_random.seed(SEED)
-    s_data_random = Random()
-    s_data_random.seed(SEED)
-
-    await RisingEdge(dut.rst)
-    await RisingEdge(dut.clk)
+    s_ctrl_random = Random(SEED)
+    s_data_random = Random(SEED)
 
-    # Data send
+    # Frames are built before the simulation starts
+    slave_frames = []
     for _ in range(NB_FRAME):
 
         # slave_nb_bytes = FRAME_SIZE_LIST[s_ctrl_random.randint(0, 4)]
@@ -106,17 +120,23 @@ async def handlerSlave(dut):
 
         slave_nb_bytes = s_ctrl_random.randint(FRAME_SIZE_1, FRAME_SIZE_2)
 
-        cocotb.log.info(f"Frame : {_} / Size : {slave_nb_bytes}")
+        if DEBUG == 1:
+            cocotb.log.info("Frame : %d / Size : %d", _, slave_nb_bytes)
 
         slave_packet_bytes = s_data_random.randbytes(slave_nb_bytes)
 
         tdata = slave_packet_bytes
-        tkeep = [1] * len(tdata)
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
         tid = PROTOCOL_UDP
-        tuser = int.from_bytes(slave_nb_bytes.to_bytes(2, 'big') + slave_ip.to_bytes(4, 'big'), 'big')
+        tuser = (slave_nb_bytes << 32) | slave_ip  # size(16) & ip(32)
+
+        slave_frames.append(AxiStreamFrame(tdata=tdata, tkeep=None, tid=tid, tdest=None, tuser=tuser))
 
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=tid, tdest=None, tuser=tuser)
+    await RisingEdge(dut.rst)
+    await RisingEdge(dut.clk)
 
+    # Data send
+    for frame in slave_frames:
         await slave.send(frame)
 
     cocotb.log.info("End of handlerSlave")
@@ -133,10 +153,8 @@ async def handlerMaster(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_ctrl_random = Random()
-    m_ctrl_random.seed(SEED)
-    m_data_random = Random()
-    m_data_random.seed(SEED)
+    m_ctrl_random = Random(SEED)
+    m_data_random = Random(SEED)
 
     await RisingEdge(dut.rst)
     await RisingEdge(dut.clk)
@@ -145,7 +163,8 @@ async def handlerMaster(dut):
     for _ in range(NB_FRAME):
 
         # master_frame_nb_btes = FRAME_SIZE_LIST[m_ctrl_random.randint(0, 4)]
-        master_ip = ETH_IP_ADDR_LIST[m_ctrl_random.randint(0, 3)]
+        master_ip_idx = m_ctrl_random.randint(0, 3)
+        master_ip = ETH_IP_ADDR_LIST[master_ip_idx]
 
         master_frame_nb_btes = m_ctrl_random.randint(FRAME_SIZE_1, FRAME_SIZE_2)
 
@@ -166,8 +185,8 @@ async def handlerMaster(dut):
 
             tdata_ctrl = Ipv4Frame(frame_id=_,
                                    sub_protocol=PROTOCOL_UDP,
-                                   ip_src=LOCAL_IP_ADDR.to_bytes(4, 'big'),
-                                   ip_dest=master_ip.to_bytes(4, 'big'),
+                                   ip_src=LOCAL_IP_ADDR_BYTES,
+                                   ip_dest=ETH_IP_ADDR_BYTES_LIST[master_ip_idx],
                                    payload=udp_part_ctrl,
                                    ttl=TTL,
                                    frag_flags=master_frag_more,
@@ -202,16 +221,7 @@ async def handlerMaster(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "* The role of the ipv4 sub-module is to :                                                                                                                *\n"
-    description += "* Manage the IPv4 protocol and its fragmentation features                                                                                                *\n"
-    description += "* Partial ICMP protocol management (ping and ping response)                                                                                              *\n"
-    description += "* Supports data padding during transmission (if enabled)                                                                                                 *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     # Error variable
@@ -245,12 +255,6 @@ async def handlermain(dut):
     await Timer(1, units='us')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n*******************************************************************************************\n"
-        print_rsl += "**                                   There are " + str(simulation_err) + " errors !                               **\n"
-        print_rsl += "*******************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n*******************************************************************************************\n"
-        print_rsl += "**                                        Simulation OK !                                **\n"
-        print_rsl += "*******************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)
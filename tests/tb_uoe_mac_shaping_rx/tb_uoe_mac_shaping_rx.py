@@ -21,8 +21,6 @@ from cocotb.triggers import RisingEdge
 from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamMonitor, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
 from random import Random
 import logging
 
@@ -46,6 +44,21 @@ ETHERTYPE_4 = 0xBEAF
 ETHERTYPE_LIST_TX = [ETHERTYPE_1, ETHERTYPE_2, ETHERTYPE_3, ETHERTYPE_4]
 
 
+# Banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "*  On the receiving side, the MAC Shaping sub-module manages the removal of the Ethernet header (MAC).                                                   *\n"
+               "*  The aim is to send random bytes with an Ethernet header and check whether the header has been removed correctly.                                      *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n*****************************************************************************************\n"
+                 "**                                  There are %d errors !                              **\n"
+                 "*****************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n*****************************************************************************************\n"
+                "**                                       Simulation OK !                               **\n"
+                "*****************************************************************************************")
+
+
 def genRandomEthernetFrame(random_gen):
     """Generation of Ethernet frame with pseudo-random way"""
     while True:
@@ -55,9 +68,9 @@ def genRandomEthernetFrame(random_gen):
                          src_mac_addr=SRC_MAC_ADDR.to_bytes(6, 'big'),
                          ethertype=ETHERTYPE_LIST_TX[random_gen.randint(0, 1)],
                          payload=random_gen.randbytes(size))
-        tdata = EthFrame.__bytes__(tdata)
-        tkeep = [1] * len(tdata)  # Generate tkeep
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
+        tdata = bytes(tdata)
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+        frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=None)
         yield frame
 
 
@@ -78,8 +91,7 @@ async def handlerSlave(dut):
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_random = Random()
-    s_random.seed(SEED)
+    s_random = Random(SEED)
     s_trans = genRandomEthernetFrame(s_random)
 
     # Init signals
@@ -110,8 +122,7 @@ async def handlerMaster(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_random = Random()
-    m_random.seed(SEED)
+    m_random = Random(SEED)
 
     # Init signal
     dut.m_tready = 0
@@ -145,14 +156,7 @@ async def handlerMaster(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "*  On the receiving side, the MAC Shaping sub-module manages the removal of the Ethernet header (MAC).                                                   *\n"
-    description += "*  The aim is to send random bytes with an Ethernet header and check whether the header has been removed correctly.                                      *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     # Error variable
@@ -181,12 +185,6 @@ async def handlermain(dut):
     await Timer(100, units='ns')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n*****************************************************************************************\n"
-        print_rsl += "**                                  There are " + str(simulation_err) + " errors !                              **\n"
-        print_rsl += "*****************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n*****************************************************************************************\n"
-        print_rsl += "**                                       Simulation OK !                               **\n"
-        print_rsl += "*****************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)
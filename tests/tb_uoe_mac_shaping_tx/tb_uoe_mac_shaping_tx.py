@@ -21,8 +21,6 @@ from cocotb.triggers import RisingEdge
 from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamMonitor, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
 from random import Random
 import logging
 
@@ -48,6 +46,22 @@ ETH_IP_ADDR_LIST = [ETH_IP_ADDR_1, ETH_IP_ADDR_2, ETH_IP_ADDR_3, ETH_IP_ADDR_4]
 ETHERTYPE_IPV4 = 0x0800
 
 
+# Banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "*  In Emmission, the MAC Shaping sub-module manages the insertion of the Ethernet header (MAC). The header's Destination MAC Address field is defined    *\n"
+               "*  using an IP Address <=> MAC Address association table.                                                                                                *\n"
+               "*  The aim is to send one of the random bytes to check whether the Ethernet header has been correctly inserted.                                          *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n*****************************************************************************************\n"
+                 "**                                  There are %d errors !                              **\n"
+                 "*****************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n*****************************************************************************************\n"
+                "**                                       Simulation OK !                               **\n"
+                "*****************************************************************************************")
+
+
 def genRandomTransfer(payload_random_gen, user_random_gen):
     """Function which generate AXIS frames"""
     while True:
@@ -58,11 +72,11 @@ def genRandomTransfer(payload_random_gen, user_random_gen):
                               ip_src=0xC0_A8_01_0A.to_bytes(4, 'big'),
                               ip_dest=ip_dest.to_bytes(4, 'big'),
                               payload=payload_random_gen.randbytes(size))
-        tdata = Ipv4Frame.__bytes__(ipv4_part)  # Generate tdata
-        tkeep = [1] * len(tdata)  # Generate tkeep
+        tdata = bytes(ipv4_part)  # Generate tdata
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
         tuser = ip_dest  # Generate tuser
         tid = ETHERTYPE_IPV4
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=tid, tdest=None, tuser=tuser)
+        frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=tid, tdest=None, tuser=tuser)
         yield frame
 
 
@@ -92,10 +106,8 @@ async def handlerSlave(dut):
     logging.getLogger("cocotb.uoe_mac_shaping_tx.s").setLevel("WARNING")
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s"), dut.clk, dut.rst, reset_active_level=False)
 
-    s_payload_random = Random()
-    s_payload_random.seed(SEED)
-    s_user_random = Random()
-    s_user_random.seed(SEED)
+    s_payload_random = Random(SEED)
+    s_user_random = Random(SEED)
     s_trans = genRandomTransfer(s_payload_random, s_user_random)
 
     # Init signals
@@ -129,8 +141,7 @@ async def handler_mac_addr(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m_ip_addr"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_random = Random()
-    s_random.seed(SEED)
+    s_random = Random(SEED)
     s_trans = genRandomTransfer_mac_addr(s_random)
 
     # Init signals
@@ -162,14 +173,11 @@ async def handlerMaster(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_payload_random = Random()
-    m_payload_random.seed(SEED)
+    m_payload_random = Random(SEED)
 
-    m_user_random_gen = Random()
-    m_user_random_gen.seed(SEED)
+    m_user_random_gen = Random(SEED)
 
-    mac_random = Random()
-    mac_random.seed(SEED)
+    mac_random = Random(SEED)
 
     # Init signal
     dut.m_tready = 0
@@ -199,7 +207,7 @@ async def handlerMaster(dut):
                              payload=ipv4_part)
 
         # Convert UDP part to compare results
-        data_ctrl = EthFrame.__bytes__(data_ctrl)
+        data_ctrl = bytes(data_ctrl)
         data_ctrl = EthFrame.from_bytes(data_ctrl)
 
         # Validity test
@@ -237,15 +245,7 @@ async def handlerMaster(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "*  In Emmission, the MAC Shaping sub-module manages the insertion of the Ethernet header (MAC). The header's Destination MAC Address field is defined    *\n"
-    description += "*  using an IP Address <=> MAC Address association table.                                                                                                *\n"
-    description += "*  The aim is to send one of the random bytes to check whether the Ethernet header has been correctly inserted.                                          *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     # Error variable
@@ -279,12 +279,6 @@ async def handlermain(dut):
     await Timer(100, units='ns')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n*****************************************************************************************\n"
-        print_rsl += "**                                  There are " + str(simulation_err) + " errors !                              **\n"
-        print_rsl += "*****************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n*****************************************************************************************\n"
-        print_rsl += "**                                       Simulation OK !                               **\n"
-        print_rsl += "*****************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)
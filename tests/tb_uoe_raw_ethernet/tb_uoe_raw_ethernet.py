@@ -21,8 +21,6 @@ from cocotb.triggers import RisingEdge
 from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
 from random import Random
 import logging
 
@@ -46,6 +44,23 @@ ETHERTYPE_4 = 0xBEAF
 ETHERTYPE_LIST = [ETHERTYPE_1, ETHERTYPE_2, ETHERTYPE_3, ETHERTYPE_4]
 
 
+# Banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "*  On the receiving side, the RAW Ethernet sub-module manages the removal of the Ethernet header (MAC).                                                  *\n"
+               "*  The aim is to send random bytes with an Ethernet header and check whether the header has been removed correctly.                                      *\n"
+               "*  In Emmission, the RAW Ethernet sub-module manages the insertion of the Ethernet header (MAC).                                                         *\n"
+               "*  The aim is to send one of the random bytes to check whether the Ethernet header has been inserted.                                                    *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n*****************************************************************************************\n"
+                 "**                                  There are %d errors !                              **\n"
+                 "*****************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n*****************************************************************************************\n"
+                "**                                       Simulation OK !                               **\n"
+                "*****************************************************************************************")
+
+
 def genRandomTransfer_rx(random_gen):
     """Generation of RAW frame with pseudo-random way for raw_ethernet_rx"""
     while True:
@@ -55,9 +70,9 @@ def genRandomTransfer_rx(random_gen):
                          src_mac_addr=SRC_MAC_ADDR.to_bytes(6, 'big'),
                          ethertype=ETHERTYPE_2,
                          payload=random_gen.randbytes(size))
-        tdata = tdata.__bytes__()
-        tkeep = [1] * len(tdata)  # Generate tkeep
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
+        tdata = bytes(tdata)
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+        frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=None)
         yield frame
 
 
@@ -66,9 +81,9 @@ def genRandomTransfer_tx(random_gen):
     while True:
         size = random_gen.randint(MIN_SIZE, MAX_SIZE)  # Generate random size
         tdata = random_gen.randbytes(size)  # Generate tdata with random bytes
-        tkeep = [1] * len(tdata)  # Generate tkeep
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
         tid = ETHERTYPE_LIST[random_gen.randint(0, 3)]  # Generate tid with random ethertype
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=tid, tdest=None, tuser=None)
+        frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=tid, tdest=None, tuser=None)
         yield frame
 
 
@@ -89,8 +104,7 @@ async def handlerSlave_rx(dut):
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s_rx"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_random = Random()
-    s_random.seed(SEED)
+    s_random = Random(SEED)
     s_trans = genRandomTransfer_rx(s_random)
 
     await RisingEdge(dut.rst)
@@ -113,8 +127,7 @@ async def handlerSlave_tx(dut):
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s_tx"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_random = Random()
-    s_random.seed(SEED)
+    s_random = Random(SEED)
     s_trans = genRandomTransfer_tx(s_random)
 
     await RisingEdge(dut.rst)
@@ -140,28 +153,27 @@ async def handlerMaster_rx(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m_rx"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_rx_random_ctrl = Random()
-    m_rx_random_ctrl.seed(SEED)
+    m_rx_random_ctrl = Random(SEED)
 
     # Data reception
     for _ in range(NB_FRAMES):
         data = await master.recv()
-        data_rslt = EthFrame(DEST_MAC_ADDR.to_bytes(6, 'big'), SRC_MAC_ADDR.to_bytes(6, 'big'), data.tid, data.tdata)
 
         # Value for test
         m_rx_size = m_rx_random_ctrl.randint(MIN_SIZE, MAX_SIZE)
         m_rx_payload = m_rx_random_ctrl.randbytes(m_rx_size)
 
-        data_ctrl = EthFrame(dst_mac_addr=DEST_MAC_ADDR.to_bytes(6, 'big'),
-                             src_mac_addr=SRC_MAC_ADDR.to_bytes(6, 'big'),
-                             ethertype=ETHERTYPE_2,
-                             payload=m_rx_payload)
-
-        # Validity test
-        if data_ctrl == data_rslt:
+        # Validity test : MAC header is removed, only ethertype and payload are compared
+        if data.tid == ETHERTYPE_2 and data.tdata == m_rx_payload:
             if DEBUG == 1:
                 cocotb.log.info(f"RAW_RX [{_}] is OK")
         else:
+            # Frames are only built for diagnostic
+            data_rslt = EthFrame(DEST_MAC_ADDR.to_bytes(6, 'big'), SRC_MAC_ADDR.to_bytes(6, 'big'), data.tid, data.tdata)
+            data_ctrl = EthFrame(dst_mac_addr=DEST_MAC_ADDR.to_bytes(6, 'big'),
+                                 src_mac_addr=SRC_MAC_ADDR.to_bytes(6, 'big'),
+                                 ethertype=ETHERTYPE_2,
+                                 payload=m_rx_payload)
             cocotb.log.error(f"RAW_RX [{_}] faillure / size {len(data_rslt.payload)}:{len(data_ctrl.payload)}(test)")
             cocotb.log.error(f"Dst_mac_addr : {data_rslt.dst_mac_addr.hex()} / Dst_mac_addr_ctrl : {data_ctrl.dst_mac_addr.hex()}")
             cocotb.log.error(f"Src_mac_addr : {data_rslt.src_mac_addr.hex()} / Src_mac_addr_ctrl : {data_ctrl.src_mac_addr.hex()}")
@@ -184,8 +196,7 @@ async def handlerMaster_tx(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m_tx"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_tx_random_ctrl = Random()
-    m_tx_random_ctrl.seed(SEED)
+    m_tx_random_ctrl = Random(SEED)
 
     # Data reception
     for _ in range(NB_FRAMES):
@@ -219,16 +230,7 @@ async def handlerMaster_tx(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "*  On the receiving side, the RAW Ethernet sub-module manages the removal of the Ethernet header (MAC).                                                  *\n"
-    description += "*  The aim is to send random bytes with an Ethernet header and check whether the header has been removed correctly.                                      *\n"
-    description += "*  In Emmission, the RAW Ethernet sub-module manages the insertion of the Ethernet header (MAC).                                                         *\n"
-    description += "*  The aim is to send one of the random bytes to check whether the Ethernet header has been inserted.                                                    *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     # Error variable
@@ -271,12 +273,6 @@ async def handlermain(dut):
     await Timer(100, units='ns')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n*****************************************************************************************\n"
-        print_rsl += "**                                  There are " + str(simulation_err) + " errors !                              **\n"
-        print_rsl += "*****************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n*****************************************************************************************\n"
-        print_rsl += "**                                       Simulation OK !                               **\n"
-        print_rsl += "*****************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)
@@ -21,8 +21,6 @@ from cocotb.triggers import RisingEdge
 from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
 from random import Random
 import logging
 
@@ -43,6 +41,21 @@ DEST_MAC_ADDR = 0xaa_bb_cc_dd_ee_ff
 ETHERTYPE = 0xABCD
 
 
+# Banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "*  On the receiving side, the RAW Ethernet sub-module manages the removal of the Ethernet header (MAC).                                                  *\n"
+               "*  The aim is to send random bytes with an Ethernet header and check whether the header has been removed correctly.                                      *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n********************************************************************************************\n"
+                 "**                                    There are %d errors !                               **\n"
+                 "********************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n********************************************************************************************\n"
+                "**                                         Simulation OK !                                **\n"
+                "********************************************************************************************")
+
+
 def genRandomTransfer(random_gen):
     """Generation of RAW frame with pseudo-random way"""
     while True:
@@ -52,9 +65,9 @@ def genRandomTransfer(random_gen):
                          src_mac_addr=SRC_MAC_ADDR.to_bytes(6, 'big'),
                          ethertype=ETHERTYPE,
                          payload=random_gen.randbytes(size))
-        tdata = tdata.__bytes__()
-        tkeep = [1] * len(tdata)  # Generate tkeep
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
+        tdata = bytes(tdata)
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+        frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=None)
         yield frame
 
 
@@ -75,8 +88,7 @@ async def handlerSlave(dut):
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_random = Random()
-    s_random.seed(SEED)
+    s_random = Random(SEED)
     s_trans = genRandomTransfer(s_random)
 
     await RisingEdge(dut.rst)
@@ -102,31 +114,30 @@ async def handlerMaster(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_random_ctrl = Random()
-    m_random_ctrl.seed(SEED)
+    m_random_ctrl = Random(SEED)
 
     # Data reception
     for _ in range(NB_FRAMES):
         data = await master.recv()
-        data_rslt = EthFrame(dst_mac_addr=DEST_MAC_ADDR.to_bytes(6, 'big'),
-                             src_mac_addr=SRC_MAC_ADDR.to_bytes(6, 'big'),
-                             ethertype=data.tid,
-                             payload=data.tdata)
 
         # Value for test
         m_size = m_random_ctrl.randint(MIN_SIZE, MAX_SIZE)
         m_payload = m_random_ctrl.randbytes(m_size)
 
-        data_ctrl = EthFrame(dst_mac_addr=DEST_MAC_ADDR.to_bytes(6, 'big'),
-                             src_mac_addr=SRC_MAC_ADDR.to_bytes(6, 'big'),
-                             ethertype=ETHERTYPE,
-                             payload=m_payload)
-
-        # Validity test
-        if data_ctrl == data_rslt:
+        # Validity test : MAC header is removed, only ethertype and payload are compared
+        if data.tid == ETHERTYPE and data.tdata == m_payload:
             if DEBUG == 1:
                 cocotb.log.info(f"RAW_RX [{_}] is OK")
         else:
+            # Frames are only built for diagnostic
+            data_rslt = EthFrame(dst_mac_addr=DEST_MAC_ADDR.to_bytes(6, 'big'),
+                                 src_mac_addr=SRC_MAC_ADDR.to_bytes(6, 'big'),
+                                 ethertype=data.tid,
+                                 payload=data.tdata)
+            data_ctrl = EthFrame(dst_mac_addr=DEST_MAC_ADDR.to_bytes(6, 'big'),
+                                 src_mac_addr=SRC_MAC_ADDR.to_bytes(6, 'big'),
+                                 ethertype=ETHERTYPE,
+                                 payload=m_payload)
             cocotb.log.error(f"RAW_RX [{_}] faillure / size {len(data_rslt.payload)}:{len(data_ctrl.payload)}(test)")
             cocotb.log.error(f"Dst_mac_addr : {data_rslt.dst_mac_addr.hex()} / Dst_mac_addr_ctrl : {data_ctrl.dst_mac_addr.hex()}")
             cocotb.log.error(f"Src_mac_addr : {data_rslt.src_mac_addr.hex()} / Src_mac_addr_ctrl : {data_ctrl.src_mac_addr.hex()}")
@@ -141,14 +152,7 @@ async def handlerMaster(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "*  On the receiving side, the RAW Ethernet sub-module manages the removal of the Ethernet header (MAC).                                                  *\n"
-    description += "*  The aim is to send random bytes with an Ethernet header and check whether the header has been removed correctly.                                      *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     global simulation_err
@@ -176,12 +180,6 @@ async def handlermain(dut):
     await Timer(100, units='ns')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n********************************************************************************************\n"
-        print_rsl += "**                                    There are " + str(simulation_err) + " errors !                               **\n"
-        print_rsl += "********************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n********************************************************************************************\n"
-        print_rsl += "**                                         Simulation OK !                                **\n"
-        print_rsl += "********************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)
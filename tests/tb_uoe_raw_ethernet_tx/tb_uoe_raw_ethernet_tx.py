@@ -21,8 +21,6 @@ from cocotb.triggers import RisingEdge
 from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
 from random import Random
 import logging
 
@@ -46,14 +44,29 @@ ETHERTYPE_4 = 0xBEAF
 ETHERTYPE_LIST = [ETHERTYPE_1, ETHERTYPE_2, ETHERTYPE_3, ETHERTYPE_4]
 
 
+# Banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "*  In Emmission, the RAW Ethernet sub-module manages the insertion of the Ethernet header (MAC).                                                         *\n"
+               "*  The aim is to send one of the random bytes to check whether the Ethernet header has been inserted.                                                    *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n********************************************************************************************\n"
+                 "**                                    There are %d errors !                               **\n"
+                 "********************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n********************************************************************************************\n"
+                "**                                         Simulation OK !                                **\n"
+                "********************************************************************************************")
+
+
 def genRandomTransfer(random_gen):
     """Generation of RAW frame with pseudo-random way"""
     while True:
         size = random_gen.randint(MIN_SIZE, MAX_SIZE)  # Generate random size
         tdata = random_gen.randbytes(size)  # Generate tdata with random bytes
-        tkeep = [1] * len(tdata)  # Generate tkeep
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
         tid = ETHERTYPE_LIST[random_gen.randint(0, 3)]  # Generate tid with random ethertype
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=tid, tdest=None, tuser=None)
+        frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=tid, tdest=None, tuser=None)
         yield frame
 
 
@@ -74,8 +87,7 @@ async def handlerSlave(dut):
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_random = Random()
-    s_random.seed(SEED)
+    s_random = Random(SEED)
     s_trans = genRandomTransfer(s_random)
 
     await RisingEdge(dut.rst)
@@ -101,8 +113,7 @@ async def handlerMaster(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_random_ctrl = Random()
-    m_random_ctrl.seed(SEED)
+    m_random_ctrl = Random(SEED)
 
     # Data reception
     for _ in range(NB_FRAMES):
@@ -138,14 +149,7 @@ async def handlerMaster(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "*  In Emmission, the RAW Ethernet sub-module manages the insertion of the Ethernet header (MAC).                                                         *\n"
-    description += "*  The aim is to send one of the random bytes to check whether the Ethernet header has been inserted.                                                    *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     # Error variable
@@ -183,12 +187,6 @@ async def handlermain(dut):
     await Timer(100, units='ns')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n********************************************************************************************\n"
-        print_rsl += "**                                    There are " + str(simulation_err) + " errors !                               **\n"
-        print_rsl += "********************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n********************************************************************************************\n"
-        print_rsl += "**                                         Simulation OK !                                **\n"
-        print_rsl += "********************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)
@@ -21,8 +21,6 @@ from cocotb.triggers import RisingEdge
 from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
 from random import Random
 import logging
 
@@ -53,6 +51,22 @@ UDP_HEADER_SIZE = 8
 FRAME_SIZE_MAX = UDP_HEADER_SIZE + PAYLOAD_MAX_SIZE
 
 
+# Banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "* The role of the UDP module layer is to manage the UDP protocol.                                                                                        *\n"
+               "* In emmission, the UDP header is inserted.                                                                                                              *\n"
+               "* The aim is to send one of the random bytes to check whether the Ethernet header has been inserted.                                                     *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n******************************************************************************************\n"
+                 "**                                   There are %d errors !                              **\n"
+                 "******************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n******************************************************************************************\n"
+                "**                                        Simulation OK !                               **\n"
+                "******************************************************************************************")
+
+
 def genRandomTransfer(random_gen):
     """Generation of UDP frame with pseudo-random way"""
     while True:
@@ -63,9 +77,9 @@ def genRandomTransfer(random_gen):
         tdata = UdpFrame(src_port=port_src,
                          dst_port=port_dest,
                          payload=random_gen.randbytes(size))
-        tdata = UdpFrame.__bytes__(tdata)
-        tkeep = [1] * len(tdata)
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=None)
+        tdata = bytes(tdata)
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+        frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=None)
         yield frame
 
 
@@ -86,8 +100,7 @@ async def handlerSlave(dut):
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_random = Random()
-    s_random.seed(SEED)
+    s_random = Random(SEED)
     s_trans = genRandomTransfer(s_random)
 
     await RisingEdge(dut.rst)
@@ -113,16 +126,15 @@ async def handlerMaster(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_random_ctrl = Random()
-    m_random_ctrl.seed(SEED)
+    m_random_ctrl = Random(SEED)
 
     # Data reception
     for _ in range(NB_FRAMES):
         data = await master.recv()
         payload = data.tdata
-        data.tuser = data.tuser.to_bytes(10, 'big')
-        port_dest = int.from_bytes(data.tuser[0:2], 'big')
-        port_src = int.from_bytes(data.tuser[2:4], 'big')
+        # tuser : port_dest(16) & port_src(16) & size(16) & ip(32)
+        port_dest = (data.tuser >> 64) & 0xFFFF
+        port_src = (data.tuser >> 48) & 0xFFFF
 
         # Value for test
         m_size = m_random_ctrl.randint(PAYLOAD_MIN_SIZE, PAYLOAD_MAX_SIZE)  # Generate random size
@@ -154,15 +166,7 @@ async def handlerMaster(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "* The role of the UDP module layer is to manage the UDP protocol.                                                                                        *\n"
-    description += "* In emmission, the UDP header is inserted.                                                                                                              *\n"
-    description += "* The aim is to send one of the random bytes to check whether the Ethernet header has been inserted.                                                     *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     # Error variable
@@ -192,12 +196,6 @@ async def handlermain(dut):
     await Timer(100, units='ns')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n******************************************************************************************\n"
-        print_rsl += "**                                   There are " + str(simulation_err) + " errors !                              **\n"
-        print_rsl += "******************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n******************************************************************************************\n"
-        print_rsl += "**                                        Simulation OK !                               **\n"
-        print_rsl += "******************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)
@@ -21,8 +21,6 @@ from cocotb.triggers import RisingEdge
 from cocotbext.axi import (AxiStreamBus, AxiStreamSource, AxiStreamSink, AxiStreamFrame)
 
 # Others
-import random
-from random import randbytes
 from random import Random
 import logging
 
@@ -53,6 +51,22 @@ UDP_HEADER_SIZE = 8
 FRAME_SIZE_MAX = UDP_HEADER_SIZE + PAYLOAD_MAX_SIZE
 
 
+# Banners
+DESCRIPTION = ("\n\n**********************************************************************************************************************************************************\n"
+               "*                                                                    Description                                                                         *\n"
+               "**********************************************************************************************************************************************************\n"
+               "*  The role of the UDP module layer is to manage the UDP protocol.                                                                                       *\n"
+               "*  On reception, the UDP header is removed.                                                                                                              *\n"
+               "*  The aim is to send random bytes with an Ethernet header and check whether the header has been removed correctly.                                      *\n"
+               "**********************************************************************************************************************************************************\n")
+PRINT_RSL_ERR = ("\n\n\n******************************************************************************************\n"
+                 "**                                   There are %d errors !                              **\n"
+                 "******************************************************************************************")
+PRINT_RSL_OK = ("\n\n\n******************************************************************************************\n"
+                "**                                        Simulation OK !                               **\n"
+                "******************************************************************************************")
+
+
 def genRandomTransfer(random_gen):
     """Generation of UDP frame with pseudo-random way"""
     while True:
@@ -61,9 +75,9 @@ def genRandomTransfer(random_gen):
         port_dest = ETH_PORT_ADDR_LIST[random_gen.randint(0, 3)]
         port_src = ETH_PORT_ADDR_LIST[random_gen.randint(0, 3)]
         tdata = random_gen.randbytes(size)  # Generate tdata with random bytes
-        tkeep = [1] * len(tdata)  # Generate tkeep
-        tuser = int.from_bytes(port_dest.to_bytes(2, 'big') + port_src.to_bytes(2, 'big') + size.to_bytes(2, 'big') + ip.to_bytes(4, 'big'), 'big')
-        frame = AxiStreamFrame(tdata=tdata, tkeep=tkeep, tid=None, tdest=None, tuser=tuser)
+        # tkeep left to None : all bytes valid once normalized by AxiStreamSource
+        tuser = (port_dest << 64) | (port_src << 48) | (size << 32) | ip  # port_dest(16) & port_src(16) & size(16) & ip(32)
+        frame = AxiStreamFrame(tdata=tdata, tkeep=None, tid=None, tdest=None, tuser=tuser)
         yield frame
 
 
@@ -92,8 +106,7 @@ async def handlerSlave(dut):
     slave = AxiStreamSource(AxiStreamBus.from_prefix(dut, "s"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    s_random = Random()
-    s_random.seed(SEED)
+    s_random = Random(SEED)
     s_trans = genRandomTransfer(s_random)
 
     await RisingEdge(dut.rst)
@@ -119,8 +132,7 @@ async def handlerMaster(dut):
     master = AxiStreamSink(AxiStreamBus.from_prefix(dut, "m"), dut.clk, dut.rst, reset_active_level=False)
 
     # Init random generator
-    m_random_ctrl = Random()
-    m_random_ctrl.seed(SEED)
+    m_random_ctrl = Random(SEED)
 
     # Data reception
     for _ in range(NB_FRAMES):
@@ -156,15 +168,7 @@ async def handlerMaster(dut):
 async def handlermain(dut):
     """Main function for starting coroutines"""
 
-    description = "\n\n**********************************************************************************************************************************************************\n"
-    description += "*                                                                    Description                                                                         *\n"
-    description += "**********************************************************************************************************************************************************\n"
-    description += "*  The role of the UDP module layer is to manage the UDP protocol.                                                                                       *\n"
-    description += "*  On reception, the UDP header is removed.                                                                                                              *\n"
-    description += "*  The aim is to send random bytes with an Ethernet header and check whether the header has been removed correctly.                                      *\n"
-    description += "**********************************************************************************************************************************************************\n"
-
-    cocotb.log.info(f"{description}")
+    cocotb.log.info(DESCRIPTION)
     cocotb.log.info("Start coroutines")
 
     # Error variable
@@ -195,12 +199,6 @@ async def handlermain(dut):
     await Timer(100, units='ns')
 
     if simulation_err >= 1:
-        print_rsl = "\n\n\n******************************************************************************************\n"
-        print_rsl += "**                                   There are " + str(simulation_err) + " errors !                              **\n"
-        print_rsl += "******************************************************************************************"
-        cocotb.log.error(f"{print_rsl}")
+        cocotb.log.error(PRINT_RSL_ERR % simulation_err)
     else:
-        print_rsl = "\n\n\n******************************************************************************************\n"
-        print_rsl += "**                                        Simulation OK !                               **\n"
-        print_rsl += "******************************************************************************************"
-        cocotb.log.info(f"{print_rsl}")
+        cocotb.log.info(PRINT_RSL_OK)